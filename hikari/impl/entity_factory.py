@@ -28,6 +28,7 @@ __all__: typing.List[str] = ["EntityFactoryImpl"]
 
 import datetime
 import logging
+import sys
 import typing
 
 import attr
@@ -2173,9 +2174,11 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         )
 
     def deserialize_voice_region(self, payload: data_binding.JSONObject) -> voice_models.VoiceRegion:
+        # Discord only has a small, fixed set of voice regions, so these strings
+        # are interned to share one object across every region listing.
         return voice_models.VoiceRegion(
-            id=payload["id"],
-            name=payload["name"],
+            id=sys.intern(payload["id"]),
+            name=sys.intern(payload["name"]),
             is_vip=payload["vip"],
             is_optimal_location=payload["optimal"],
             is_deprecated=payload["deprecated"],
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import datetime
+import sys
 
 import mock
 import pytest
@@ -3840,6 +3841,15 @@ class TestEntityFactoryImpl:
         assert voice_region.is_custom is False
         assert isinstance(voice_region, voice_models.VoiceRegion)
 
+    def test_deserialize_voice_region_interns_strings(self, entity_factory_impl, voice_region_payload):
+        voice_region_payload["id"] = "".join(["lon", "don"])
+        voice_region_payload["name"] = "".join(["LON", "DON"])
+
+        voice_region = entity_factory_impl.deserialize_voice_region(voice_region_payload)
+
+        assert voice_region.id is sys.intern("london")
+        assert voice_region.name is sys.intern("LONDON")
+
     ##################
     # WEBHOOK MODELS #
     ##################
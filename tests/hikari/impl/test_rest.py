@@ -23,6 +23,7 @@ import asyncio
 import contextlib
 import datetime
 import http
+import types
 
 import aiohttp
 import mock
@@ -100,6 +101,8 @@ class TestRestProvider:
 # ClientCredentialsStrategy #
 #############################
 
+_DEFAULT_CLIENT_CREDENTIALS_SCOPES = ("applications.commands.update", "identify")
+
 
 @pytest.mark.asyncio()
 class TestClientCredentialsStrategy:
@@ -131,7 +134,7 @@ class TestClientCredentialsStrategy:
         assert result == "Bearer okokok.fofofo.ddd"
 
         mock_rest.authorize_client_credentials_token.assert_awaited_once_with(
-            client=54123123, client_secret="123123123", scopes=("applications.commands.update", "identify")
+            client=54123123, client_secret="123123123", scopes=_DEFAULT_CLIENT_CREDENTIALS_SCOPES
         )
 
     async def test_acquire_handles_out_of_date_token(self, mock_token):
@@ -151,19 +154,16 @@ class TestClientCredentialsStrategy:
             new_token = await strategy.acquire(mock_rest)
 
         mock_rest.authorize_client_credentials_token.assert_awaited_once_with(
-            client=3412321, client_secret="54123123", scopes=("applications.commands.update", "identify")
+            client=3412321, client_secret="54123123", scopes=_DEFAULT_CLIENT_CREDENTIALS_SCOPES
         )
         assert new_token != token
         assert new_token == "Bearer okokok.fofofo.ddd"  # noqa S105: Possible Hardcoded password
 
     async def test_acquire_handles_token_being_set_before_lock_is_acquired(self, mock_token):
-        lock = asyncio.Lock()
         mock_rest = mock.Mock(authorize_client_credentials_token=mock.AsyncMock(side_effect=[mock_token]))
+        strategy = rest.ClientCredentialsStrategy(client=6512312, client_secret="453123123")
 
-        with mock.patch.object(asyncio, "Lock", return_value=lock):
-            strategy = rest.ClientCredentialsStrategy(client=6512312, client_secret="453123123")
-
-        async with lock:
+        async with strategy._lock:
             tokens_gather = asyncio.gather(
                 strategy.acquire(mock_rest), strategy.acquire(mock_rest), strategy.acquire(mock_rest)
             )
@@ -171,7 +171,7 @@ class TestClientCredentialsStrategy:
         results = await tokens_gather
 
         mock_rest.authorize_client_credentials_token.assert_awaited_once_with(
-            client=6512312, client_secret="453123123", scopes=("applications.commands.update", "identify")
+            client=6512312, client_secret="453123123", scopes=_DEFAULT_CLIENT_CREDENTIALS_SCOPES
         )
         assert results == [
             "Bearer okokok.fofofo.ddd",
@@ -196,7 +196,7 @@ class TestClientCredentialsStrategy:
         new_token = await strategy.acquire(mock_rest)
 
         mock_rest.authorize_client_credentials_token.assert_awaited_once_with(
-            client=123, client_secret="123456", scopes=("applications.commands.update", "identify")
+            client=123, client_secret="123456", scopes=_DEFAULT_CLIENT_CREDENTIALS_SCOPES
         )
         assert new_token != token
         assert new_token == "Bearer okokok.fofofo.ddd"  # noqa S105: Possible Hardcoded password
@@ -206,17 +206,25 @@ class TestClientCredentialsStrategy:
         mock_rest = mock.AsyncMock()
         strategy = rest.ClientCredentialsStrategy(client=65123, client_secret="12354")
 
+        lock_held = asyncio.Event()
+        release_lock = asyncio.Event()
+
         async def hold_strategy():
             async with strategy._lock:
-                await asyncio.sleep(hikari_test_helpers.REASONABLE_SLEEP_TIME)
+                lock_held.set()
+                await release_lock.wait()
                 strategy._token = token
                 strategy._expire_at = time.monotonic() + 600
 
-        asyncio.create_task(hold_strategy())
-        await asyncio.sleep(hikari_test_helpers.REASONABLE_SLEEP_TIME // 1000)
-        result = await strategy.acquire(mock_rest)
+        hold_task = asyncio.create_task(hold_strategy())
+        await lock_held.wait()
+        acquire_task = asyncio.create_task(strategy.acquire(mock_rest))
+        # Let acquire start waiting on the lock before the token gets set.
+        await asyncio.sleep(0)
+        release_lock.set()
 
-        assert result == token
+        assert await acquire_task == token
+        await hold_task
 
         mock_rest.authorize_client_credentials_token.assert_not_called()
 
@@ -235,7 +243,7 @@ class TestClientCredentialsStrategy:
             await strategy.acquire(mock_rest)
 
         mock_rest.authorize_client_credentials_token.assert_awaited_once_with(
-            client=65123, client_secret="12354", scopes=("applications.commands.update", "identify")
+            client=65123, client_secret="12354", scopes=_DEFAULT_CLIENT_CREDENTIALS_SCOPES
         )
 
     async def test_close(self):
@@ -325,37 +333,39 @@ def rest_client(rest_client_class):
     return obj
 
 
-@pytest.fixture()
-def file_resource():
-    class Stream:
-        def __init__(self, data):
-            self.data = data
+class StubStream:
+    def __init__(self, data):
+        self.data = data
 
-        async def data_uri(self):
-            return self.data
+    async def data_uri(self):
+        return self.data
 
-        async def __aenter__(self):
-            return self
+    async def __aenter__(self):
+        return self
 
-        async def __aexit__(
-            self,
-            exc_type,
-            exc,
-            exc_tb,
-        ) -> None:
-            pass
+    async def __aexit__(
+        self,
+        exc_type,
+        exc,
+        exc_tb,
+    ) -> None:
+        pass
 
-    class FileResource(files.Resource):
-        filename = None
-        url = None
 
-        def __init__(self, stream_data):
-            self._stream = Stream(data=stream_data)
+class StubFileResource(files.Resource):
+    filename = None
+    url = None
 
-        def stream(self, executor):
-            return self._stream
+    def __init__(self, stream_data):
+        self._stream = StubStream(data=stream_data)
 
-    return FileResource
+    def stream(self, executor):
+        return self._stream
+
+
+@pytest.fixture()
+def file_resource():
+    return StubFileResource
 
 
 @pytest.fixture()
@@ -365,6 +375,26 @@ def file_resource_patch(file_resource):
         yield resource
 
 
+@pytest.fixture()
+def url_encoded_form():
+    form = mock.Mock()
+    with mock.patch.object(data_binding, "URLEncodedForm", return_value=form):
+        yield form
+
+
+class StubResponse(types.SimpleNamespace):
+    """Stand-in for `aiohttp.ClientResponse` which only has the attributes it was given.
+
+    `read` and `json` return the `body` and `json_body` attributes.
+    """
+
+    async def read(self):
+        return self.body
+
+    async def json(self):
+        return self.json_body
+
+
 class StubModel(snowflakes.Unique):
     id = None
 
@@ -401,57 +431,28 @@ class TestRESTClientImpl:
                 entity_factory=None,
             )
 
-    def test__init__when_token_is_None_sets_token_to_None(self):
-        obj = rest.RESTClientImpl(
-            http_settings=mock.Mock(),
-            max_rate_limit=float("inf"),
-            proxy_settings=mock.Mock(),
-            token=None,
-            token_type=None,
-            rest_url=None,
-            executor=None,
-            entity_factory=None,
-        )
-        assert obj._token is None
-
-    def test__init__when_token_and_token_type_is_not_None_generates_token_with_type(self):
-        obj = rest.RESTClientImpl(
-            http_settings=mock.Mock(),
-            max_rate_limit=float("inf"),
-            proxy_settings=mock.Mock(),
-            token="some_token",
-            token_type="tYpe",
-            rest_url=None,
-            executor=None,
-            entity_factory=None,
-        )
-        assert obj._token == "Type some_token"
-
-    def test__init__when_rest_url_is_None_generates_url_using_default_url(self):
+    @pytest.mark.parametrize(
+        ("token", "token_type", "rest_url", "expected_token", "expected_rest_url"),
+        [
+            (None, None, None, None, urls.REST_API_URL),
+            ("some_token", "tYpe", None, "Type some_token", urls.REST_API_URL),
+            (None, None, "https://some.where/api/v2", None, "https://some.where/api/v2"),
+        ],
+    )
+    def test__init__sets_token_and_rest_url(self, token, token_type, rest_url, expected_token, expected_rest_url):
         obj = rest.RESTClientImpl(
             http_settings=mock.Mock(),
             max_rate_limit=float("inf"),
             proxy_settings=mock.Mock(),
-            token=None,
-            token_type=None,
-            rest_url=None,
+            token=token,
+            token_type=token_type,
+            rest_url=rest_url,
             executor=None,
             entity_factory=None,
         )
-        assert obj._rest_url == urls.REST_API_URL
 
-    def test__init__when_rest_url_is_not_None_generates_url_using_given_url(self):
-        obj = rest.RESTClientImpl(
-            http_settings=mock.Mock(),
-            max_rate_limit=float("inf"),
-            proxy_settings=mock.Mock(),
-            token=None,
-            token_type=None,
-            rest_url="https://some.where/api/v2",
-            executor=None,
-            entity_factory=None,
-        )
-        assert obj._rest_url == "https://some.where/api/v2"
+        assert obj._token == expected_token
+        assert obj._rest_url == expected_rest_url
 
     def test___enter__(self, rest_client):
         # flake8 gets annoyed if we use "with" here so here's a hacky alternative
@@ -611,84 +612,51 @@ class TestRESTClientImpl:
             )
 
     @pytest.mark.parametrize(
-        "before",
+        ("kwargs", "expected_direction", "expected_first_id"),
         [
-            datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc),
-            StubModel(735757641938108416),
-        ],
-    )
-    def test_fetch_messages_with_before(self, rest_client, before):
-        channel = StubModel(123)
-        stub_iterator = mock.Mock()
-
-        with mock.patch.object(special_endpoints, "MessageIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_messages(channel, before=before) == stub_iterator
-
-            iterator.assert_called_once_with(
-                entity_factory=rest_client._entity_factory,
-                request_call=rest_client._request,
-                channel=channel,
-                direction="before",
-                first_id="735757641938108416",
-            )
-
-    @pytest.mark.parametrize(
-        "after",
-        [
-            datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc),
-            StubModel(735757641938108416),
+            ({}, "before", undefined.UNDEFINED),
+            (
+                {"before": datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc)},
+                "before",
+                "735757641938108416",
+            ),
+            ({"before": StubModel(735757641938108416)}, "before", "735757641938108416"),
+            (
+                {"after": datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc)},
+                "after",
+                "735757641938108416",
+            ),
+            ({"after": StubModel(735757641938108416)}, "after", "735757641938108416"),
+            (
+                {"around": datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc)},
+                "around",
+                "735757641938108416",
+            ),
+            ({"around": StubModel(735757641938108416)}, "around", "735757641938108416"),
         ],
-    )
-    def test_fetch_messages_with_after(self, rest_client, after):
-        channel = StubModel(123)
-        stub_iterator = mock.Mock()
-
-        with mock.patch.object(special_endpoints, "MessageIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_messages(channel, after=after) == stub_iterator
-
-            iterator.assert_called_once_with(
-                entity_factory=rest_client._entity_factory,
-                request_call=rest_client._request,
-                channel=channel,
-                direction="after",
-                first_id="735757641938108416",
-            )
-
-    @pytest.mark.parametrize(
-        "around",
-        [
-            datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc),
-            StubModel(735757641938108416),
+        ids=[
+            "default",
+            "before_datetime",
+            "before_unique",
+            "after_datetime",
+            "after_unique",
+            "around_datetime",
+            "around_unique",
         ],
     )
-    def test_fetch_messages_with_around(self, rest_client, around):
-        channel = StubModel(123)
-        stub_iterator = mock.Mock()
-
-        with mock.patch.object(special_endpoints, "MessageIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_messages(channel, around=around) == stub_iterator
-
-            iterator.assert_called_once_with(
-                entity_factory=rest_client._entity_factory,
-                request_call=rest_client._request,
-                channel=channel,
-                direction="around",
-                first_id="735757641938108416",
-            )
-
-    def test_fetch_messages_with_default(self, rest_client):
+    def test_fetch_messages(self, rest_client, kwargs, expected_direction, expected_first_id):
         channel = StubModel(123)
         stub_iterator = mock.Mock()
 
         with mock.patch.object(special_endpoints, "MessageIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_messages(channel) == stub_iterator
+            assert rest_client.fetch_messages(channel, **kwargs) == stub_iterator
 
             iterator.assert_called_once_with(
                 entity_factory=rest_client._entity_factory,
                 request_call=rest_client._request,
                 channel=channel,
-                direction="before",
-                first_id=undefined.UNDEFINED,
+                direction=expected_direction,
+                first_id=expected_first_id,
             )
 
     @pytest.mark.parametrize(
@@ -774,57 +742,38 @@ class TestRESTClientImpl:
                 name="hikari",
             )
 
-    def test_fetch_audit_log_when_before_is_undefined(self, rest_client):
-        guild = StubModel(123)
-        stub_iterator = mock.Mock()
-
-        with mock.patch.object(special_endpoints, "AuditLogIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_audit_log(guild) == stub_iterator
-
-            iterator.assert_called_once_with(
-                entity_factory=rest_client._entity_factory,
-                request_call=rest_client._request,
-                guild=guild,
-                before=undefined.UNDEFINED,
-                user=undefined.UNDEFINED,
-                action_type=undefined.UNDEFINED,
-            )
-
-    def test_fetch_audit_log_when_before_datetime(self, rest_client):
-        guild = StubModel(123)
-        user = StubModel(456)
-        stub_iterator = mock.Mock()
-        datetime_obj = datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc)
-
-        with mock.patch.object(special_endpoints, "AuditLogIterator", return_value=stub_iterator) as iterator:
-            returned = rest_client.fetch_audit_log(
-                guild, user=user, before=datetime_obj, event_type=audit_logs.AuditLogEventType.GUILD_UPDATE
-            )
-            assert returned is stub_iterator
-
-            iterator.assert_called_once_with(
-                entity_factory=rest_client._entity_factory,
-                request_call=rest_client._request,
-                guild=guild,
-                before="735757641938108416",
-                user=user,
-                action_type=audit_logs.AuditLogEventType.GUILD_UPDATE,
-            )
-
-    def test_fetch_audit_log_when_before_is_else(self, rest_client):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_before", "expected_user", "expected_action_type"),
+        [
+            ({}, undefined.UNDEFINED, undefined.UNDEFINED, undefined.UNDEFINED),
+            (
+                {
+                    "user": StubModel(456),
+                    "before": datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc),
+                    "event_type": audit_logs.AuditLogEventType.GUILD_UPDATE,
+                },
+                "735757641938108416",
+                StubModel(456),
+                audit_logs.AuditLogEventType.GUILD_UPDATE,
+            ),
+            ({"before": StubModel(456)}, "456", undefined.UNDEFINED, undefined.UNDEFINED),
+        ],
+        ids=["before_undefined", "before_datetime", "before_unique"],
+    )
+    def test_fetch_audit_log(self, rest_client, kwargs, expected_before, expected_user, expected_action_type):
         guild = StubModel(123)
         stub_iterator = mock.Mock()
 
         with mock.patch.object(special_endpoints, "AuditLogIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_audit_log(guild, before=StubModel(456)) == stub_iterator
+            assert rest_client.fetch_audit_log(guild, **kwargs) is stub_iterator
 
             iterator.assert_called_once_with(
                 entity_factory=rest_client._entity_factory,
                 request_call=rest_client._request,
                 guild=guild,
-                before="456",
-                user=undefined.UNDEFINED,
-                action_type=undefined.UNDEFINED,
+                before=expected_before,
+                user=expected_user,
+                action_type=expected_action_type,
             )
 
     def test_fetch_members(self, rest_client):
@@ -859,6 +808,23 @@ class TestRESTClientImplAsync:
 
         return ExitException
 
+    @pytest.fixture()
+    def compiled_route(self):
+        return routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+
+    @pytest.fixture()
+    def mock_session(self, rest_client):
+        mock_session = mock.AsyncMock()
+        rest_client.buckets.is_started = True
+        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+        return mock_session
+
+    @pytest.fixture()
+    def token_strategy(self):
+        return mock.Mock(
+            rest_api.TokenStrategy, acquire=mock.AsyncMock(side_effect=["Bearer ok.ok.ok", "Bearer ok2.ok2.ok2"])
+        )
+
     async def test___aenter__and__aexit__(self, rest_client):
         with mock.patch.object(rest_client, "close") as close:
             async with rest_client as client:
@@ -868,42 +834,34 @@ class TestRESTClientImplAsync:
         close.assert_awaited_once_with()
 
     @hikari_test_helpers.timeout()
-    async def test__request_with_strategy_token(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=exit_exception))
-        rest_client.buckets.is_started = True
-        rest_client._token = mock.Mock(rest_api.TokenStrategy, acquire=mock.AsyncMock(return_value="Bearer ok.ok.ok"))
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_with_strategy_token(self, rest_client, exit_exception, compiled_route, mock_session):
         rest_client._stringify_http_message = mock.Mock()
+        mock_session.request.side_effect = exit_exception
+        rest_client._token = mock.Mock(rest_api.TokenStrategy, acquire=mock.AsyncMock(return_value="Bearer ok.ok.ok"))
         with pytest.raises(exit_exception):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
-        _, kwargs = mock_session.request.call_args_list[0]
+        mock_session.request.assert_called_once()
+        _, kwargs = mock_session.request.call_args
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "Bearer ok.ok.ok"
 
     @hikari_test_helpers.timeout()
-    async def test__request_retries_strategy_once(self, rest_client, exit_exception):
-        class StubResponse:
-            status = http.HTTPStatus.UNAUTHORIZED
-            content_type = rest._APPLICATION_JSON
-            reason = "cause why not"
-            headers = {"HEADER": "value", "HEADER": "value"}
-
-            async def read(self):
-                return '{"something": null}'
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(
-            request=hikari_test_helpers.CopyingAsyncMock(side_effect=[StubResponse(), exit_exception])
-        )
-        rest_client.buckets.is_started = True
-        rest_client._token = mock.Mock(
-            rest_api.TokenStrategy, acquire=mock.AsyncMock(side_effect=["Bearer ok.ok.ok", "Bearer ok2.ok2.ok2"])
-        )
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_retries_strategy_once(
+        self, rest_client, exit_exception, compiled_route, mock_session, token_strategy
+    ):
         rest_client._stringify_http_message = mock.Mock()
+        response = StubResponse(
+            status=http.HTTPStatus.UNAUTHORIZED,
+            content_type=rest._APPLICATION_JSON,
+            reason="cause why not",
+            headers={"HEADER": "value"},
+            body='{"something": null}',
+        )
+
+        mock_session.request = hikari_test_helpers.CopyingAsyncMock(side_effect=[response, exit_exception])
+        rest_client._token = token_strategy
         with pytest.raises(exit_exception):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
         _, kwargs = mock_session.request.call_args_list[0]
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "Bearer ok.ok.ok"
@@ -911,32 +869,22 @@ class TestRESTClientImplAsync:
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "Bearer ok2.ok2.ok2"
 
     @hikari_test_helpers.timeout()
-    async def test__request_raises_after_retry(self, rest_client, exit_exception):
-        class StubResponse:
-            status = http.HTTPStatus.UNAUTHORIZED
-            content_type = rest._APPLICATION_JSON
-            reason = "cause why not"
-            headers = {"HEADER": "value", "HEADER": "value"}
-            real_url = "okokokok"
-
-            async def read(self):
-                return '{"something": null}'
-
-            async def json(self):
-                return {"something": None}
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(
-            request=hikari_test_helpers.CopyingAsyncMock(side_effect=[StubResponse(), StubResponse(), StubResponse()])
-        )
-        rest_client.buckets.is_started = True
-        rest_client._token = mock.Mock(
-            rest_api.TokenStrategy, acquire=mock.AsyncMock(side_effect=["Bearer ok.ok.ok", "Bearer ok2.ok2.ok2"])
-        )
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_raises_after_retry(self, rest_client, compiled_route, mock_session, token_strategy):
         rest_client._stringify_http_message = mock.Mock()
+        response = StubResponse(
+            status=http.HTTPStatus.UNAUTHORIZED,
+            content_type=rest._APPLICATION_JSON,
+            reason="cause why not",
+            headers={"HEADER": "value"},
+            real_url="okokokok",
+            body='{"something": null}',
+            json_body={"something": None},
+        )
+
+        mock_session.request = hikari_test_helpers.CopyingAsyncMock(side_effect=[response, response, response])
+        rest_client._token = token_strategy
         with pytest.raises(errors.UnauthorizedError):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
         _, kwargs = mock_session.request.call_args_list[0]
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "Bearer ok.ok.ok"
@@ -944,189 +892,137 @@ class TestRESTClientImplAsync:
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "Bearer ok2.ok2.ok2"
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_buckets_not_started(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+    async def test__request_when_buckets_not_started(self, rest_client, exit_exception, compiled_route):
         rest_client.buckets.is_started = False
         rest_client.buckets.acquire.side_effect = exit_exception
 
         with pytest.raises(exit_exception):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
         rest_client.buckets.start.assert_called_once()
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_buckets_started(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+    async def test__request_when_buckets_started(self, rest_client, exit_exception, compiled_route):
         rest_client.buckets.acquire.side_effect = exit_exception
         rest_client.buckets.is_started = True
 
         with pytest.raises(exit_exception):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
         rest_client.buckets.start.assert_not_called()
 
+    @pytest.mark.parametrize(
+        ("token", "kwargs", "expected_header", "global_rate_limited"),
+        [
+            (None, {}, None, True),
+            ("token", {}, "token", True),
+            ("token", {"no_auth": True}, None, False),
+            ("token", {"auth": "ooga booga"}, "ooga booga", True),
+        ],
+    )
     @hikari_test_helpers.timeout()
-    async def test__request_when__token_is_None(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=exit_exception))
-        rest_client.buckets.is_started = True
-        rest_client._token = None
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
-        rest_client._stringify_http_message = mock.Mock()
-        with pytest.raises(exit_exception):
-            await rest_client._request(route)
-
-        _, kwargs = mock_session.request.call_args_list[0]
-        assert rest._AUTHORIZATION_HEADER not in kwargs["headers"]
-
-    @hikari_test_helpers.timeout()
-    async def test__request_when__token_is_not_None(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=exit_exception))
-        rest_client.buckets.is_started = True
-        rest_client._token = "token"
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
-        rest_client._stringify_http_message = mock.Mock()
-        with pytest.raises(exit_exception):
-            await rest_client._request(route)
-
-        _, kwargs = mock_session.request.call_args_list[0]
-        assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "token"
-
-    @hikari_test_helpers.timeout()
-    async def test__request_when_no_auth_passed(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=exit_exception))
-        rest_client.buckets.is_started = True
-        rest_client._token = "token"
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_authorization(
+        self,
+        rest_client,
+        exit_exception,
+        compiled_route,
+        mock_session,
+        token,
+        kwargs,
+        expected_header,
+        global_rate_limited,
+    ):
         rest_client._stringify_http_message = mock.Mock()
+        mock_session.request.side_effect = exit_exception
+        rest_client._token = token
         with pytest.raises(exit_exception):
-            await rest_client._request(route, no_auth=True)
+            await rest_client._request(compiled_route, **kwargs)
 
-        _, kwargs = mock_session.request.call_args_list[0]
-        assert rest._AUTHORIZATION_HEADER not in kwargs["headers"]
-        rest_client.buckets.acquire.assert_called_once_with(route)
+        mock_session.request.assert_called_once()
+        _, request_kwargs = mock_session.request.call_args
+        if expected_header is None:
+            assert rest._AUTHORIZATION_HEADER not in request_kwargs["headers"]
+        else:
+            assert request_kwargs["headers"][rest._AUTHORIZATION_HEADER] == expected_header
+        rest_client.buckets.acquire.assert_called_once_with(compiled_route)
         rest_client.buckets.acquire.return_value.assert_used_once()
-        rest_client.global_rate_limit.acquire.assert_not_called()
+        if global_rate_limited:
+            rest_client.global_rate_limit.acquire.assert_awaited_once_with()
+        else:
+            rest_client.global_rate_limit.acquire.assert_not_called()
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_auth_passed(self, rest_client, exit_exception):
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=exit_exception))
-        rest_client.buckets.is_started = True
-        rest_client._token = "token"
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_when_response_is_NO_CONTENT(self, rest_client, compiled_route, mock_session):
         rest_client._stringify_http_message = mock.Mock()
-        with pytest.raises(exit_exception):
-            await rest_client._request(route, auth="ooga booga")
+        response = StubResponse(status=http.HTTPStatus.NO_CONTENT, reason="cause why not")
 
-        _, kwargs = mock_session.request.call_args_list[0]
-        assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "ooga booga"
-        rest_client.buckets.acquire.assert_called_once_with(route)
-        rest_client.buckets.acquire.return_value.assert_used_once()
-        rest_client.global_rate_limit.acquire.assert_awaited_once_with()
+        mock_session.request.return_value = response
+        rest_client._parse_ratelimits = mock.AsyncMock()
+        assert (await rest_client._request(compiled_route)) is None
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_response_is_NO_CONTENT(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.NO_CONTENT
-            reason = "cause why not"
+    async def test__request_when_response_is_APPLICATION_JSON(self, rest_client, compiled_route, mock_session):
+        rest_client._stringify_http_message = mock.Mock()
+        response = StubResponse(
+            status=http.HTTPStatus.OK,
+            content_type=rest._APPLICATION_JSON,
+            reason="cause why not",
+            headers={"HEADER": "value"},
+            body='{"something": null}',
+        )
 
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(return_value=StubResponse()))
-        rest_client.buckets.is_started = True
+        mock_session.request.return_value = response
         rest_client._parse_ratelimits = mock.AsyncMock()
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
-        rest_client._stringify_http_message = mock.Mock()
-        assert (await rest_client._request(route)) is None
+        assert (await rest_client._request(compiled_route)) == {"something": None}
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_response_is_APPLICATION_JSON(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.OK
-            content_type = rest._APPLICATION_JSON
-            reason = "cause why not"
-            headers = {"HEADER": "value", "HEADER": "value"}
-
-            async def read(self):
-                return '{"something": null}'
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(return_value=StubResponse()))
-        rest_client.buckets.is_started = True
-        rest_client._parse_ratelimits = mock.AsyncMock()
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_when_response_is_not_JSON(self, rest_client, compiled_route, mock_session):
         rest_client._stringify_http_message = mock.Mock()
-        assert (await rest_client._request(route)) == {"something": None}
+        response = StubResponse(
+            status=http.HTTPStatus.IM_USED,
+            content_type="text/html",
+            reason="cause why not",
+            real_url="https://some.url",
+        )
 
-    @hikari_test_helpers.timeout()
-    async def test__request_when_response_is_not_JSON(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.IM_USED
-            content_type = "text/html"
-            reason = "cause why not"
-            real_url = "https://some.url"
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(return_value=StubResponse()))
-        rest_client.buckets.is_started = True
+        mock_session.request.return_value = response
         rest_client._parse_ratelimits = mock.AsyncMock()
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
-        rest_client._stringify_http_message = mock.Mock()
         with pytest.raises(errors.HTTPError):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_response_is_not_between_200_and_300(self, rest_client, exit_exception):
-        class StubResponse:
-            status = http.HTTPStatus.NOT_IMPLEMENTED
-            content_type = "text/html"
-            reason = "cause why not"
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(return_value=StubResponse()))
-        rest_client.buckets.is_started = True
+    async def test__request_when_response_is_not_between_200_and_300(
+        self, rest_client, exit_exception, compiled_route, mock_session
+    ):
+        rest_client._stringify_http_message = mock.Mock()
+        response = StubResponse(
+            status=http.HTTPStatus.NOT_IMPLEMENTED, content_type="text/html", reason="cause why not"
+        )
+
+        mock_session.request.return_value = response
         rest_client._parse_ratelimits = mock.AsyncMock()
         rest_client._handle_error_response = mock.AsyncMock(side_effect=exit_exception)
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
-        rest_client._stringify_http_message = mock.Mock()
         with pytest.raises(exit_exception):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
     @hikari_test_helpers.timeout()
-    async def test__request_when_response__RetryRequest_gets_handled(self, rest_client, exit_exception):
-        class StubResponse:
-            status = http.HTTPStatus.USE_PROXY
-            content_type = "text/html"
-            reason = "cause why not"
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=[rest_client._RetryRequest, exit_exception]))
-        rest_client.buckets.is_started = True
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
+    async def test__request_when_response__RetryRequest_gets_handled(
+        self, rest_client, exit_exception, compiled_route, mock_session
+    ):
+        mock_session.request.side_effect = [rest_client._RetryRequest, exit_exception]
         with pytest.raises(exit_exception):
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
     @pytest.mark.parametrize("enabled", [True, False])
     @hikari_test_helpers.timeout()
-    async def test__request_logger(self, rest_client, enabled):
-        class StubResponse:
-            status = http.HTTPStatus.NO_CONTENT
-            headers = {}
-            reason = "cause why not"
-
-            async def read(self):
-                return None
+    async def test__request_logger(self, rest_client, enabled, compiled_route, mock_session):
+        response = StubResponse(status=http.HTTPStatus.NO_CONTENT, reason="cause why not", headers={}, body=None)
 
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        mock_session = mock.AsyncMock(request=mock.AsyncMock(return_value=StubResponse()))
-        rest_client.buckets.is_started = True
+        mock_session.request.return_value = response
         rest_client._parse_ratelimits = mock.AsyncMock()
-        rest_client._acquire_client_session = mock.Mock(return_value=mock_session)
 
         with mock.patch.object(rest, "_LOGGER", new=mock.Mock(isEnabledFor=mock.Mock(return_value=enabled))) as logger:
-            await rest_client._request(route)
+            await rest_client._request(compiled_route)
 
         if enabled:
             assert logger.log.call_count == 2
@@ -1141,106 +1037,79 @@ class TestRESTClientImplAsync:
 
             generate_error_response.assert_called_once_with(mock_response)
 
-    async def test__parse_ratelimits_when_not_ratelimited(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.OK
-            headers = {}
-
-            json = mock.AsyncMock()
+    async def test__parse_ratelimits_when_not_ratelimited(self, rest_client, compiled_route):
+        response = StubResponse(status=http.HTTPStatus.OK, headers={}, json=mock.AsyncMock())
 
-        response = StubResponse()
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        await rest_client._parse_ratelimits(route, response)
+        await rest_client._parse_ratelimits(compiled_route, response)
         response.json.assert_not_called()
 
-    async def test__parse_ratelimits_when_ratelimited(self, rest_client, exit_exception):
-        class StubResponse:
-            status = http.HTTPStatus.TOO_MANY_REQUESTS
-            content_type = rest._APPLICATION_JSON
-            headers = {}
-
-            async def json(self):
-                raise exit_exception
+    async def test__parse_ratelimits_when_ratelimited(self, rest_client, exit_exception, compiled_route):
+        response = StubResponse(
+            status=http.HTTPStatus.TOO_MANY_REQUESTS,
+            content_type=rest._APPLICATION_JSON,
+            headers={},
+            json=mock.AsyncMock(side_effect=exit_exception),
+        )
 
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(exit_exception):
-            await rest_client._parse_ratelimits(route, StubResponse())
-
-    async def test__parse_ratelimits_when_unexpected_content_type(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.TOO_MANY_REQUESTS
-            content_type = "text/html"
-            headers = {}
-            real_url = "https://some.url"
+            await rest_client._parse_ratelimits(compiled_route, response)
 
-            async def read(self):
-                return "this is not json :)"
+    async def test__parse_ratelimits_when_unexpected_content_type(self, rest_client, compiled_route):
+        response = StubResponse(
+            status=http.HTTPStatus.TOO_MANY_REQUESTS,
+            content_type="text/html",
+            headers={},
+            real_url="https://some.url",
+            body="this is not json :)",
+        )
 
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(errors.HTTPResponseError):
-            await rest_client._parse_ratelimits(route, StubResponse())
-
-    async def test__parse_ratelimits_when_global_ratelimit(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.TOO_MANY_REQUESTS
-            content_type = rest._APPLICATION_JSON
-            headers = {}
-            real_url = "https://some.url"
+            await rest_client._parse_ratelimits(compiled_route, response)
 
-            async def json(self):
-                return {"global": True, "retry_after": "2"}
+    async def test__parse_ratelimits_when_global_ratelimit(self, rest_client, compiled_route):
+        response = StubResponse(
+            status=http.HTTPStatus.TOO_MANY_REQUESTS,
+            content_type=rest._APPLICATION_JSON,
+            headers={},
+            real_url="https://some.url",
+            json_body={"global": True, "retry_after": "2"},
+        )
 
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(rest_client._RetryRequest):
-            await rest_client._parse_ratelimits(route, StubResponse())
+            await rest_client._parse_ratelimits(compiled_route, response)
 
         rest_client.global_rate_limit.throttle.assert_called_once_with(2.0)
 
-    async def test__parse_ratelimits_when_remaining_header_under_or_equal_to_0(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.TOO_MANY_REQUESTS
-            content_type = rest._APPLICATION_JSON
-            headers = {
-                rest._X_RATELIMIT_REMAINING_HEADER: "0",
-            }
-            real_url = "https://some.url"
-
-            async def json(self):
-                return {"retry_after": "2", "global": False}
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        with pytest.raises(rest_client._RetryRequest):
-            await rest_client._parse_ratelimits(route, StubResponse())
-
-    async def test__parse_ratelimits_when_retry_after_is_close_enough(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.TOO_MANY_REQUESTS
-            content_type = rest._APPLICATION_JSON
-            headers = {
-                rest._X_RATELIMIT_RESET_AFTER_HEADER: "0.002",
-            }
-            real_url = "https://some.url"
-
-            async def json(self):
-                return {"retry_after": "0.002"}
-
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        with pytest.raises(rest_client._RetryRequest):
-            await rest_client._parse_ratelimits(route, StubResponse())
-
-    async def test__parse_ratelimits_when_retry_after_is_not_close_enough(self, rest_client):
-        class StubResponse:
-            status = http.HTTPStatus.TOO_MANY_REQUESTS
-            content_type = rest._APPLICATION_JSON
-            headers = {}
-            real_url = "https://some.url"
-
-            async def json(self):
-                return {"retry_after": "4"}
+    @pytest.mark.parametrize(
+        ("headers", "json_body", "expected_exception"),
+        [
+            (
+                {rest._X_RATELIMIT_REMAINING_HEADER: "0"},
+                {"retry_after": "2", "global": False},
+                rest.RESTClientImpl._RetryRequest,
+            ),
+            (
+                {rest._X_RATELIMIT_RESET_AFTER_HEADER: "0.002"},
+                {"retry_after": "0.002"},
+                rest.RESTClientImpl._RetryRequest,
+            ),
+            ({}, {"retry_after": "4"}, errors.RateLimitedError),
+        ],
+        ids=["remaining_header_under_or_equal_to_0", "retry_after_close_enough", "retry_after_not_close_enough"],
+    )
+    async def test__parse_ratelimits_when_bucket_ratelimited(
+        self, rest_client, compiled_route, headers, json_body, expected_exception
+    ):
+        response = StubResponse(
+            status=http.HTTPStatus.TOO_MANY_REQUESTS,
+            content_type=rest._APPLICATION_JSON,
+            headers=headers,
+            real_url="https://some.url",
+            json_body=json_body,
+        )
 
-        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
-        with pytest.raises(errors.RateLimitedError):
-            await rest_client._parse_ratelimits(route, StubResponse())
+        with pytest.raises(expected_exception):
+            await rest_client._parse_ratelimits(compiled_route, response)
 
     async def test_close_when__client_session_is_None(self, rest_client):
         rest_client._client_session = None
@@ -1372,27 +1241,25 @@ class TestRESTClientImplAsync:
             expected_route, json={"channel_id": "999", "suppress": True, "request_to_speak_timestamp": "blamblamblam"}
         )
 
-    async def test_edit_my_voice_state_when_revoking_speak_request(self, rest_client):
-        rest_client._request = mock.AsyncMock()
-        expected_route = routes.PATCH_MY_GUILD_VOICE_STATE.compile(guild=5421)
-
-        result = await rest_client.edit_my_voice_state(
-            StubModel(5421), StubModel(999), suppress=True, request_to_speak=False
-        )
-
-        assert result is None
-        rest_client._request.assert_awaited_once_with(
-            expected_route, json={"channel_id": "999", "suppress": True, "request_to_speak_timestamp": None}
-        )
-
-    async def test_edit_my_voice_state_without_optional_fields(self, rest_client):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_json"),
+        [
+            (
+                {"suppress": True, "request_to_speak": False},
+                {"channel_id": "999", "suppress": True, "request_to_speak_timestamp": None},
+            ),
+            ({}, {"channel_id": "999"}),
+        ],
+        ids=["revoking_speak_request", "without_optional_fields"],
+    )
+    async def test_edit_my_voice_state(self, rest_client, kwargs, expected_json):
         rest_client._request = mock.AsyncMock()
         expected_route = routes.PATCH_MY_GUILD_VOICE_STATE.compile(guild=5421)
 
-        result = await rest_client.edit_my_voice_state(StubModel(5421), StubModel(999))
+        result = await rest_client.edit_my_voice_state(StubModel(5421), StubModel(999), **kwargs)
 
         assert result is None
-        rest_client._request.assert_awaited_once_with(expected_route, json={"channel_id": "999"})
+        rest_client._request.assert_awaited_once_with(expected_route, json=expected_json)
 
     async def test_edit_voice_state(self, rest_client):
         rest_client._request = mock.AsyncMock()
@@ -1467,6 +1334,7 @@ class TestRESTClientImplAsync:
                 channels.PermissionOverwriteType.MEMBER,
             ),
         ],
+        ids=["user", "role", "overwrite"],
     )
     async def test_edit_permission_overwrites_when_target_undefined(self, rest_client, target, expected_type):
         expected_route = routes.PATCH_CHANNEL_PERMISSIONS.compile(channel=123, overwrite=456)
@@ -1662,18 +1530,16 @@ class TestRESTClientImplAsync:
 
         await rest_client.delete_messages(channel, messages, StubModel(444), StubModel(6523))
 
-        rest_client._request.assert_has_awaits(
-            [
-                mock.call(
-                    routes.POST_DELETE_CHANNEL_MESSAGES_BULK.compile(channel=channel),
-                    json={"messages": [str(i) for i in range(100)]},
-                ),
-                mock.call(
-                    routes.POST_DELETE_CHANNEL_MESSAGES_BULK.compile(channel=channel),
-                    json={"messages": ["100", "444", "6523"]},
-                ),
-            ]
-        )
+        assert rest_client._request.await_args_list == [
+            mock.call(
+                routes.POST_DELETE_CHANNEL_MESSAGES_BULK.compile(channel=channel),
+                json={"messages": [str(i) for i in range(100)]},
+            ),
+            mock.call(
+                routes.POST_DELETE_CHANNEL_MESSAGES_BULK.compile(channel=channel),
+                json={"messages": ["100", "444", "6523"]},
+            ),
+        ]
 
     async def test_add_reaction(self, rest_client):
         expected_route = routes.PUT_MY_REACTION.compile(emoji="rooYay:123", channel=123, message=456)
@@ -1861,13 +1727,12 @@ class TestRESTClientImplAsync:
     async def test_execute_webhook(self, rest_client):
         ...  # TODO: Implement
 
-    async def test_execute_webhook_when_attachment_and_attachments_given(self, rest_client):
-        with pytest.raises(ValueError, match="You may only specify one of 'attachment' or 'attachments', not both"):
-            await rest_client.execute_webhook(StubModel(123), "token", attachment=object(), attachments=object())
-
-    async def test_execute_webhook_when_embed_and_embeds_given(self, rest_client):
-        with pytest.raises(ValueError, match="You may only specify one of 'embed' or 'embeds', not both"):
-            await rest_client.execute_webhook(StubModel(123), "token", embed=object(), embeds=object())
+    @pytest.mark.parametrize(("singular_arg", "plural_arg"), [("attachment", "attachments"), ("embed", "embeds")])
+    async def test_execute_webhook_when_singular_and_plural_args_given(self, rest_client, singular_arg, plural_arg):
+        with pytest.raises(
+            ValueError, match=f"You may only specify one of '{singular_arg}' or '{plural_arg}', not both"
+        ):
+            await rest_client.execute_webhook(StubModel(123), "token", **{singular_arg: object(), plural_arg: object()})
 
     async def test_fetch_webhook_message(self, rest_client):
         message_obj = mock.Mock()
@@ -2031,31 +1896,27 @@ class TestRESTClientImplAsync:
         )
         rest_client._request.assert_awaited_once_with(expected_route)
 
-    async def test_authorize_client_credentials_token(self, rest_client):
+    async def test_authorize_client_credentials_token(self, rest_client, url_encoded_form):
         expected_route = routes.POST_TOKEN.compile()
-        mock_url_encoded_form = mock.Mock()
         rest_client._request = mock.AsyncMock(return_value={"access_token": "43212123123123"})
 
-        with mock.patch.object(data_binding, "URLEncodedForm", return_value=mock_url_encoded_form):
-            await rest_client.authorize_client_credentials_token(65234123, "4312312", scopes=["scope1", "scope2"])
+        await rest_client.authorize_client_credentials_token(65234123, "4312312", scopes=["scope1", "scope2"])
 
-        mock_url_encoded_form.add_field.assert_has_calls(
+        url_encoded_form.add_field.assert_has_calls(
             [mock.call("grant_type", "client_credentials"), mock.call("scope", "scope1 scope2")]
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, form=mock_url_encoded_form, auth="Basic NjUyMzQxMjM6NDMxMjMxMg=="
+            expected_route, form=url_encoded_form, auth="Basic NjUyMzQxMjM6NDMxMjMxMg=="
         )
         rest_client._entity_factory.deserialize_partial_token.assert_called_once_with(rest_client._request.return_value)
 
-    async def test_authorize_access_token_without_scopes(self, rest_client):
+    async def test_authorize_access_token(self, rest_client, url_encoded_form):
         expected_route = routes.POST_TOKEN.compile()
-        mock_url_encoded_form = mock.Mock()
         rest_client._request = mock.AsyncMock(return_value={"access_token": 42})
 
-        with mock.patch.object(data_binding, "URLEncodedForm", return_value=mock_url_encoded_form):
-            result = await rest_client.authorize_access_token(65234, "43123", "a.code", "htt:redirect//me")
+        result = await rest_client.authorize_access_token(65234, "43123", "a.code", "htt:redirect//me")
 
-        mock_url_encoded_form.add_field.assert_has_calls(
+        url_encoded_form.add_field.assert_has_calls(
             [
                 mock.call("grant_type", "authorization_code"),
                 mock.call("code", "a.code"),
@@ -2067,44 +1928,25 @@ class TestRESTClientImplAsync:
             rest_client._request.return_value
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, form=mock_url_encoded_form, auth="Basic NjUyMzQ6NDMxMjM="
+            expected_route, form=url_encoded_form, auth="Basic NjUyMzQ6NDMxMjM="
         )
 
-    async def test_authorize_access_token_with_scopes(self, rest_client):
-        expected_route = routes.POST_TOKEN.compile()
-        mock_url_encoded_form = mock.Mock()
-        rest_client._request = mock.AsyncMock(return_value={"access_token": 42})
-
-        with mock.patch.object(data_binding, "URLEncodedForm", return_value=mock_url_encoded_form):
-            result = await rest_client.authorize_access_token(12343, "1235555", "a.codee", "htt:redirect//mee")
-
-        mock_url_encoded_form.add_field.assert_has_calls(
-            [
-                mock.call("grant_type", "authorization_code"),
-                mock.call("code", "a.codee"),
-                mock.call("redirect_uri", "htt:redirect//mee"),
-            ]
-        )
-        assert result is rest_client._entity_factory.deserialize_authorization_token.return_value
-        rest_client._entity_factory.deserialize_authorization_token.assert_called_once_with(
-            rest_client._request.return_value
-        )
-        rest_client._request.assert_awaited_once_with(
-            expected_route, form=mock_url_encoded_form, auth="Basic MTIzNDM6MTIzNTU1NQ=="
-        )
-
-    async def test_refresh_access_token_without_scopes(self, rest_client):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_scope_fields"),
+        [({}, []), ({"scopes": ["1", "3", "scope43"]}, [mock.call("scope", "1 3 scope43")])],
+        ids=["without_scopes", "with_scopes"],
+    )
+    async def test_refresh_access_token(self, rest_client, url_encoded_form, kwargs, expected_scope_fields):
         expected_route = routes.POST_TOKEN.compile()
-        mock_url_encoded_form = mock.Mock()
         rest_client._request = mock.AsyncMock(return_value={"access_token": 42})
 
-        with mock.patch.object(data_binding, "URLEncodedForm", return_value=mock_url_encoded_form):
-            result = await rest_client.refresh_access_token(454123, "123123", "a.codet")
+        result = await rest_client.refresh_access_token(454123, "123123", "a.codet", **kwargs)
 
-        mock_url_encoded_form.add_field.assert_has_calls(
+        url_encoded_form.add_field.assert_has_calls(
             [
                 mock.call("grant_type", "refresh_token"),
                 mock.call("refresh_token", "a.codet"),
+                *expected_scope_fields,
             ]
         )
         assert result is rest_client._entity_factory.deserialize_authorization_token.return_value
@@ -2112,43 +1954,18 @@ class TestRESTClientImplAsync:
             rest_client._request.return_value
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, form=mock_url_encoded_form, auth="Basic NDU0MTIzOjEyMzEyMw=="
-        )
-
-    async def test_refresh_access_token_with_scopes(self, rest_client):
-        expected_route = routes.POST_TOKEN.compile()
-        mock_url_encoded_form = mock.Mock()
-        rest_client._request = mock.AsyncMock(return_value={"access_token": 42})
-
-        with mock.patch.object(data_binding, "URLEncodedForm", return_value=mock_url_encoded_form):
-            result = await rest_client.refresh_access_token(54123, "312312", "a.codett", scopes=["1", "3", "scope43"])
-
-        mock_url_encoded_form.add_field.assert_has_calls(
-            [
-                mock.call("grant_type", "refresh_token"),
-                mock.call("refresh_token", "a.codett"),
-                mock.call("scope", "1 3 scope43"),
-            ]
-        )
-        assert result is rest_client._entity_factory.deserialize_authorization_token.return_value
-        rest_client._entity_factory.deserialize_authorization_token.assert_called_once_with(
-            rest_client._request.return_value
-        )
-        rest_client._request.assert_awaited_once_with(
-            expected_route, form=mock_url_encoded_form, auth="Basic NTQxMjM6MzEyMzEy"
+            expected_route, form=url_encoded_form, auth="Basic NDU0MTIzOjEyMzEyMw=="
         )
 
-    async def test_revoke_access_token(self, rest_client):
+    async def test_revoke_access_token(self, rest_client, url_encoded_form):
         expected_route = routes.POST_TOKEN_REVOKE.compile()
-        mock_url_encoded_form = mock.Mock()
         rest_client._request = mock.AsyncMock()
 
-        with mock.patch.object(data_binding, "URLEncodedForm", return_value=mock_url_encoded_form):
-            await rest_client.revoke_access_token(54123, "123542", "not.a.token")
+        await rest_client.revoke_access_token(54123, "123542", "not.a.token")
 
-        mock_url_encoded_form.add_field.assert_called_once_with("token", "not.a.token")
+        url_encoded_form.add_field.assert_called_once_with("token", "not.a.token")
         rest_client._request.assert_awaited_once_with(
-            expected_route, form=mock_url_encoded_form, auth="Basic NTQxMjM6MTIzNTQy"
+            expected_route, form=url_encoded_form, auth="Basic NTQxMjM6MTIzNTQy"
         )
 
     async def test_add_user_to_guild(self, rest_client):
@@ -2424,7 +2241,7 @@ class TestRESTClientImplAsync:
 
     async def test_create_guild_text_channel(self, rest_client):
         guild = StubModel(123)
-        channel = mock.Mock(channels.GuildTextChannel)
+        channel = mock.Mock(spec_set=channels.GuildTextChannel)
         category_channel = StubModel(789)
         overwrite1 = StubModel(987)
         overwrite2 = StubModel(654)
@@ -2490,7 +2307,7 @@ class TestRESTClientImplAsync:
 
     async def test_create_guild_voice_channel(self, rest_client):
         guild = StubModel(123)
-        channel = mock.Mock(channels.GuildVoiceChannel)
+        channel = mock.Mock(spec_set=channels.GuildVoiceChannel)
         category_channel = StubModel(789)
         overwrite1 = StubModel(987)
         overwrite2 = StubModel(654)
@@ -2525,7 +2342,7 @@ class TestRESTClientImplAsync:
 
     async def test_create_guild_stage_channel(self, rest_client):
         guild = StubModel(123)
-        channel = mock.Mock(channels.GuildStageChannel)
+        channel = mock.Mock(spec_set=channels.GuildStageChannel)
         category_channel = StubModel(789)
         overwrite1 = StubModel(987)
         overwrite2 = StubModel(654)
@@ -2658,9 +2475,18 @@ class TestRESTClientImplAsync:
         rest_client._entity_factory.deserialize_member.assert_called_once_with({"id": "764435"}, guild_id=645234123)
         rest_client._request.assert_awaited_once_with(expected_route, query=expected_query)
 
-    async def test_edit_member(self, rest_client):
+    @pytest.mark.parametrize(
+        ("voice_channel", "expected_channel_id"), [(StubModel(987), "987"), (None, None)], ids=["channel", "None"]
+    )
+    async def test_edit_member(self, rest_client, voice_channel, expected_channel_id):
         expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
-        expected_json = {"nick": "test", "roles": ["654", "321"], "mute": True, "deaf": False, "channel_id": "987"}
+        expected_json = {
+            "nick": "test",
+            "roles": ["654", "321"],
+            "mute": True,
+            "deaf": False,
+            "channel_id": expected_channel_id,
+        }
         rest_client._request = mock.AsyncMock(return_value={"id": "789"})
 
         result = await rest_client.edit_member(
@@ -2670,7 +2496,7 @@ class TestRESTClientImplAsync:
             roles=[StubModel(654), StubModel(321)],
             mute=True,
             deaf=False,
-            voice_channel=StubModel(987),
+            voice_channel=voice_channel,
             reason="because i can",
         )
 
@@ -2680,32 +2506,6 @@ class TestRESTClientImplAsync:
         )
         rest_client._request.assert_awaited_once_with(expected_route, json=expected_json, reason="because i can")
 
-    async def test_edit_member_when_voice_channel_is_None(self, rest_client):
-        expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
-        expected_json = {"nick": "test", "roles": ["654", "321"], "mute": True, "deaf": False, "channel_id": None}
-        rest_client._request = mock.AsyncMock(return_value={"id": "789"})
-
-        result = await rest_client.edit_member(
-            StubModel(123),
-            StubModel(456),
-            nick="test",
-            roles=[StubModel(654), StubModel(321)],
-            mute=True,
-            deaf=False,
-            voice_channel=None,
-            reason="because i can",
-        )
-
-        assert result is rest_client._entity_factory.deserialize_member.return_value
-        rest_client._entity_factory.deserialize_member.assert_called_once_with(
-            rest_client._request.return_value, guild_id=123
-        )
-        rest_client._request.assert_awaited_once_with(
-            expected_route,
-            json=expected_json,
-            reason="because i can",
-        )
-
     async def test_edit_member_without_optionals(self, rest_client):
         expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
         rest_client._request = mock.AsyncMock(return_value={"id": "789"})
@@ -2854,10 +2654,8 @@ class TestRESTClientImplAsync:
         rest_client._entity_factory.deserialize_role.assert_called_once_with({"id": "456"}, guild_id=123)
 
     async def test_create_role_when_color_and_colour_specified(self, rest_client):
-        with pytest.raises(TypeError):
-            await rest_client.create_role(
-                StubModel(123), color=colors.Color.from_int(12345), colour=colors.Color.from_int(12345)
-            )
+        with pytest.raises(TypeError, match="Can not specify 'color' and 'colour' together."):
+            await rest_client.create_role(StubModel(123), color=object(), colour=object())
 
     async def test_reposition_roles(self, rest_client):
         expected_route = routes.POST_GUILD_ROLES.compile(guild=123)
@@ -2895,10 +2693,8 @@ class TestRESTClientImplAsync:
         rest_client._entity_factory.deserialize_role.assert_called_once_with({"id": "456"}, guild_id=123)
 
     async def test_edit_role_when_color_and_colour_specified(self, rest_client):
-        with pytest.raises(TypeError):
-            await rest_client.edit_role(
-                StubModel(123), StubModel(456), color=colors.Color.from_int(12345), colour=colors.Color.from_int(12345)
-            )
+        with pytest.raises(TypeError, match="Can not specify 'color' and 'colour' together."):
+            await rest_client.edit_role(StubModel(123), StubModel(456), color=object(), colour=object())
 
     async def test_delete_role(self, rest_client):
         expected_route = routes.DELETE_GUILD_ROLE.compile(guild=123, role=456)
@@ -19,11 +19,73 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import copy
+
 import mock
+import pytest
 
 from hikari import voices
 
 
+@pytest.fixture()
+def voice_region():
+    return voices.VoiceRegion(
+        id="us-east", name="US", is_vip=False, is_optimal_location=True, is_deprecated=False, is_custom=False
+    )
+
+
+@pytest.fixture()
+def voice_state():
+    return voices.VoiceState(
+        app=mock.Mock(),
+        channel_id=None,
+        guild_id=456,
+        is_guild_deafened=False,
+        is_guild_muted=False,
+        is_self_deafened=False,
+        is_self_muted=False,
+        is_streaming=False,
+        is_suppressed=False,
+        is_video_enabled=False,
+        user_id=123,
+        member=mock.Mock(),
+        session_id="4a5b6c",
+        requested_to_speak_at=None,
+    )
+
+
 def test_VoiceRegion_str_operator():
     mock_region = mock.Mock(voices.VoiceRegion, id="eu or something idk")
     assert voices.VoiceRegion.__str__(mock_region) == "eu or something idk"
+
+
+def test_VoiceRegion_hash_operator():
+    mock_region = mock.Mock(voices.VoiceRegion, id="eu or something idk")
+    assert voices.VoiceRegion.__hash__(mock_region) == hash("eu or something idk")
+
+
+def test_VoiceRegion_eq_operator(voice_region):
+    same_id = copy.copy(voice_region)
+    same_id.name = "Not US"
+    other_id = copy.copy(voice_region)
+    other_id.id = "europe"
+
+    assert voice_region == same_id
+    assert voice_region != other_id
+    assert voice_region != "us-east"
+
+
+def test_VoiceState_hash_operator():
+    mock_state = mock.Mock(voices.VoiceState, session_id="4a5b6c")
+    assert voices.VoiceState.__hash__(mock_state) == hash("4a5b6c")
+
+
+def test_VoiceState_eq_operator(voice_state):
+    same_session = copy.copy(voice_state)
+    same_session.user_id = 789
+    other_session = copy.copy(voice_state)
+    other_session.session_id = "7d8e9f"
+
+    assert voice_state == same_session
+    assert voice_state != other_session
+    assert voice_state != "4a5b6c"